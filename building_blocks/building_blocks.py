@@ -25,7 +25,8 @@ import json
 import sqlite3
 import numpy as np
 from typing import Any, Dict, List, Optional, Callable
-from queue import Queue as ThreadQueue
+from collections import deque, Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
@@ -100,15 +101,35 @@ class Worker:
     Good for: Background jobs, data processing, scheduled tasks
     """
     
-    def __init__(self, name: str, max_concurrent_jobs: int = 3):
+    def __init__(self, name: str, max_concurrent_jobs: int = 3, job_done: threading.Condition = None):
         self.name = name
         self.max_concurrent_jobs = max_concurrent_jobs
         self.job_handlers = {}
         self.active_jobs = {}
-        self.completed_jobs = []
+        # Bounded: only the most recent completions are retained so a
+        # long-running Worker does not grow without limit; aggregate numbers
+        # live in completion_counts and the get_stats() totals.
+        self.completed_jobs = deque(maxlen=2048)
         self.failed_jobs = []
         self.running = False
         self.worker_thread = None
+        self._executor = None  # Thread pool for job execution, created on start()
+        # Pending jobs in submission order; the dispatch loop sleeps on
+        # work_available and is woken by submit_job, so there is no
+        # fixed-interval polling over the job table.
+        self.pending_jobs = deque()
+        self.work_available = threading.Condition()
+        self._processing_count = 0
+        # Notified whenever a job finishes (completed or failed) so callers
+        # can wait for completions instead of polling get_stats().
+        # A shared Condition can be passed in to watch several Workers at once.
+        self.job_done = job_done or threading.Condition()
+        # get_stats() cache, invalidated whenever the job counts move
+        self._stats_cache = None
+        self._stats_counts = None
+        # Completion tally by (job_type, result domain) so callers can read
+        # per-dimension counts without rescanning the completed_jobs list
+        self.completion_counts = Counter()
     
     def register_job_type(self, job_type: str, handler: Callable):
         """Register a handler for a specific job type"""
@@ -124,19 +145,58 @@ class Worker:
             "id": job_id,
             "type": job_type,
             "data": job_data,
+            # Resolved once here so the dispatch path never hashes the type
+            "handler": self.job_handlers.get(job_type),
             "submitted_at": datetime.now(),
             "status": "queued"
         }
         
         # In a real implementation, this would go to a proper queue
-        # For education, we'll use a simple dict
+        # For education, we keep a dict for status lookups plus a deque
+        # feeding the dispatch loop
         self.active_jobs[job_id] = job
+        with self.work_available:
+            self.pending_jobs.append(job)
+            self.work_available.notify()
         return job_id
-    
+
+    def submit_jobs(self, jobs: List[tuple]) -> List[str]:
+        """Submit a batch of (job_type, job_data) pairs in one lock acquisition
+
+        Triggers that fire close together can consolidate their submissions
+        into a single batch instead of taking the work lock once per job.
+        """
+        import random
+        batch = []
+        job_ids = []
+        for job_type, job_data in jobs:
+            job_id = f"{job_type}_{int(time.time() * 1000)}_{random.randint(1000, 9999)}"
+            job = {
+                "id": job_id,
+                "type": job_type,
+                "data": job_data,
+                "handler": self.job_handlers.get(job_type),
+                "submitted_at": datetime.now(),
+                "status": "queued"
+            }
+            self.active_jobs[job_id] = job
+            batch.append(job)
+            job_ids.append(job_id)
+
+        with self.work_available:
+            self.pending_jobs.extend(batch)
+            self.work_available.notify_all()
+        return job_ids
+
     def start(self):
         """Start the worker thread for background processing"""
         if not self.running:
             self.running = True
+            # Reusable pool of job threads instead of one fresh thread per job
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrent_jobs,
+                thread_name_prefix=f"{self.name}_job"
+            )
             self.worker_thread = threading.Thread(target=self._work_loop, daemon=True)
             self.worker_thread.start()
             print(f"🔧 Worker '{self.name}' started")
@@ -144,41 +204,42 @@ class Worker:
     def stop(self):
         """Stop the worker thread"""
         self.running = False
+        with self.work_available:
+            self.work_available.notify_all()  # Wake the dispatch loop so it can exit
         if self.worker_thread and self.worker_thread.is_alive():
             self.worker_thread.join(timeout=5)  # Wait up to 5 seconds for clean shutdown
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
     def _work_loop(self):
-        """Main worker loop - processes jobs from the queue"""
+        """Main worker loop - dispatches pending jobs as slots free up"""
         while self.running:
-            # Find queued jobs
-            queued_jobs = [job for job in self.active_jobs.values() 
-                          if job["status"] == "queued"]
-            
-            # Process jobs up to max concurrent limit
-            processing_count = len([job for job in self.active_jobs.values() 
-                                  if job["status"] == "processing"])
-            
-            for job in queued_jobs:
-                if processing_count >= self.max_concurrent_jobs:
+            with self.work_available:
+                # Sleep until a job is submitted or a concurrency slot opens
+                while self.running and (not self.pending_jobs or
+                                        self._processing_count >= self.max_concurrent_jobs):
+                    self.work_available.wait(timeout=1.0)
+                if not self.running:
                     break
-                
-                # Start processing job
-                job["status"] = "processing"
-                job["started_at"] = datetime.now()
-                threading.Thread(target=self._process_job, args=(job,)).start()
-                processing_count += 1
+                job = self.pending_jobs.popleft()
+                self._processing_count += 1
             
-            time.sleep(0.1)  # Small delay to prevent busy waiting
+            # Start processing job on the pool
+            job["status"] = "processing"
+            job["started_at"] = datetime.now()
+            self._executor.submit(self._process_job, job)
     
     def _process_job(self, job: Dict):
         """Process a single job"""
+        completed_key = None
         try:
-            job_type = job["type"]
-            if job_type not in self.job_handlers:
-                raise Exception(f"No handler for job type: {job_type}")
+            # Handler was bound at submit time; no table lookup here
+            handler = job["handler"]
+            if handler is None:
+                raise Exception(f"No handler for job type: {job['type']}")
             
             # Execute the job handler
-            handler = self.job_handlers[job_type]
             result = handler(job["data"])
             
             # Mark job as completed
@@ -188,6 +249,8 @@ class Worker:
             
             # Move to completed jobs
             self.completed_jobs.append(job)
+            domain = result.get("domain") if isinstance(result, dict) else None
+            completed_key = (job["type"], domain)
             del self.active_jobs[job["id"]]
             
         except Exception as e:
@@ -199,6 +262,19 @@ class Worker:
             # Move to failed jobs
             self.failed_jobs.append(job)
             del self.active_jobs[job["id"]]
+        
+        # Free a concurrency slot and wake the dispatch loop. The Counter
+        # bump is a read-modify-write racing across pool threads, so it
+        # happens under the same lock.
+        with self.work_available:
+            if completed_key is not None:
+                self.completion_counts[completed_key] += 1
+            self._processing_count -= 1
+            self.work_available.notify()
+        
+        # Wake anyone waiting on job completions
+        with self.job_done:
+            self.job_done.notify_all()
     
     def get_job_status(self, job_id: str) -> Optional[Dict]:
         """Get the status of a specific job"""
@@ -219,15 +295,21 @@ class Worker:
         return None
     
     def get_stats(self):
-        """Get worker performance statistics"""
-        total_jobs = len(self.active_jobs) + len(self.completed_jobs) + len(self.failed_jobs)
-        return {
-            "total_jobs": total_jobs,
-            "completed_jobs": len(self.completed_jobs),
-            "failed_jobs": len(self.failed_jobs),
-            "active_jobs": len(self.active_jobs),
-            "success_rate": len(self.completed_jobs) / max(1, len(self.completed_jobs) + len(self.failed_jobs)) * 100
+        """Get worker performance statistics (cached until the job counts change)"""
+        counts = (len(self.active_jobs), len(self.completed_jobs), len(self.failed_jobs))
+        if self._stats_counts == counts and self._stats_cache is not None:
+            return self._stats_cache
+        
+        active, completed, failed = counts
+        self._stats_counts = counts
+        self._stats_cache = {
+            "total_jobs": active + completed + failed,
+            "completed_jobs": completed,
+            "failed_jobs": failed,
+            "active_jobs": active,
+            "success_rate": completed / max(1, completed + failed) * 100
         }
+        return self._stats_cache
 
 
 # =============================================================================
@@ -439,20 +521,35 @@ class Queue:
     Good for: Event-driven architecture, message passing, workflow coordination
     """
     
-    def __init__(self, name: str, max_size: int = 1000):
+    def __init__(self, name: str, max_size: int = 1000, auto_start: bool = True):
         self.name = name
         self.max_size = max_size
-        self.queue = ThreadQueue(maxsize=max_size)
+        # Single producer, single dispatch thread: a plain deque is enough.
+        # append/popleft are atomic under CPython, so the hot enqueue path
+        # never takes a lock; the condition only parks the dispatcher when
+        # the queue is empty.
+        self.queue = deque()
+        self._not_empty = threading.Condition()
         self.message_count = 0
         self.processed_count = 0
         self.failed_count = 0
         self.subscribers = {}  # message_type -> callback mapping
+        self.running = False
+        self.dispatch_thread = None
+
+        # Start auto-dispatch thread (pass auto_start=False to pre-load
+        # messages and kick off dispatch later with start())
+        if auto_start:
+            self.start()
+
+    def start(self):
+        """Start the auto-dispatch thread (no-op if already running)"""
+        if self.running:
+            return
         self.running = True
-        
-        # Start auto-dispatch thread
         self.dispatch_thread = threading.Thread(target=self._auto_dispatch_loop, daemon=True)
         self.dispatch_thread.start()
-    
+
     def subscriber(self, message_type: str = "*"):
         """Decorator to register subscribers that automatically process messages"""
         def decorator(callback_func):
@@ -477,22 +574,35 @@ class Queue:
                 "priority": priority
             }
             
-            self.queue.put(message_envelope, block=False)
+            if len(self.queue) >= self.max_size:
+                print(f"📬 Queue {self.name} is full, message rejected")
+                return False
+
+            self.queue.append(message_envelope)
             self.message_count += 1
+            with self._not_empty:
+                self._not_empty.notify()
             print(f"📬 Enqueued {message_type} message to {self.name}")
             return True
             
         except:
-            # Queue is full
-            print(f"📬 Queue {self.name} is full, message rejected")
+            print(f"📬 Queue {self.name} rejected a message")
             return False
     
     def _auto_dispatch_loop(self):
         """Automatically dequeue messages and dispatch to subscribers"""
         while self.running:
             try:
-                # Wait for a message (blocking with timeout)
-                message_envelope = self.queue.get(timeout=1.0)
+                # Wait for a message (blocking with timeout). The emptiness
+                # check happens while holding the condition, so an enqueue
+                # that notifies between check and wait cannot be missed.
+                with self._not_empty:
+                    if not self.queue:
+                        self._not_empty.wait(timeout=1.0)
+                try:
+                    message_envelope = self.queue.popleft()
+                except IndexError:
+                    continue
                 
                 if message_envelope:
                     message_type = message_envelope.get("message_type", "default")
@@ -528,7 +638,12 @@ class Queue:
         Note: Auto-dispatch will handle most messages automatically
         """
         try:
-            message_envelope = self.queue.get(timeout=timeout)
+            # Check-then-wait under the condition, same as the dispatch loop,
+            # so a concurrent enqueue's notify is never lost
+            with self._not_empty:
+                if not self.queue:
+                    self._not_empty.wait(timeout=timeout)
+            message_envelope = self.queue.popleft()
             message_envelope["dequeued_at"] = datetime.now()
             return message_envelope
         except:
@@ -536,19 +651,21 @@ class Queue:
     
     def size(self) -> int:
         """Get current queue size"""
-        return self.queue.qsize()
+        return len(self.queue)
     
     def is_empty(self) -> bool:
         """Check if queue is empty"""
-        return self.queue.empty()
+        return not self.queue
     
     def is_full(self) -> bool:
         """Check if queue is full"""
-        return self.queue.full()
+        return len(self.queue) >= self.max_size
     
     def stop(self):
         """Stop the auto-dispatch thread"""
         self.running = False
+        with self._not_empty:
+            self._not_empty.notify_all()
         if self.dispatch_thread and self.dispatch_thread.is_alive():
             self.dispatch_thread.join(timeout=2)
     
@@ -738,21 +855,27 @@ class VectorDB:
         
         with self.lock:
             self.search_count += 1
+            if not self.vectors:
+                return []
+
             query_np = np.array(query_vector)
-            similarities = []
-            
-            for vector_id, vector in self.vectors.items():
-                # Calculate cosine similarity
-                similarity = np.dot(query_np, vector) / (np.linalg.norm(query_np) * np.linalg.norm(vector))
-                similarities.append({
-                    "id": vector_id,
-                    "similarity": float(similarity),
-                    "metadata": self.metadata[vector_id]
-                })
-            
-            # Sort by similarity (descending) and return top_k
-            similarities.sort(key=lambda x: x["similarity"], reverse=True)
-            return similarities[:top_k]
+            vector_ids = list(self.vectors.keys())
+
+            # One vectorized cosine-similarity pass over all stored vectors
+            # instead of a Python-level loop with a dot product per vector
+            matrix = np.stack([self.vectors[vector_id] for vector_id in vector_ids])
+            scores = matrix @ query_np / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(query_np))
+
+            # Pick the top_k highest-scoring vectors
+            top_indices = np.argsort(scores)[::-1][:top_k]
+            return [
+                {
+                    "id": vector_ids[i],
+                    "similarity": float(scores[i]),
+                    "metadata": self.metadata[vector_ids[i]]
+                }
+                for i in top_indices
+            ]
     
     def get_vector(self, vector_id: str) -> Optional[List[float]]:
         """Retrieve a vector by ID"""
@@ -17,6 +17,8 @@ but rather sources of requirements that drive our system design.
 
 import time
 import threading
+import heapq
+import itertools
 import requests
 import random
 from datetime import datetime, timedelta
@@ -44,6 +46,46 @@ class Time:
         self.scheduler_thread = None
         self.tick_count = 0
         self.trigger_count = 0
+        # Deadline heap: the monitor thread sleeps until the earliest entry
+        # instead of polling every second. The event cuts the sleep short
+        # when a new trigger is scheduled or monitoring stops.
+        self._deadline_heap = []
+        self._heap_seq = itertools.count()
+        # Registrations and delegated pushes arrive from other threads, so
+        # every heap mutation happens under this lock
+        self._heap_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        # The entity whose monitor thread runs our triggers; normally
+        # ourselves, but share_scheduler_with() can delegate to another Time
+        self._scheduler = self
+
+    def _push_deadline(self, deadline: float, trigger_id: str, entity: "Time" = None):
+        """Schedule a trigger on the owning scheduler's heap and wake it"""
+        if self._scheduler is not self:
+            self._scheduler._push_deadline(deadline, trigger_id, entity or self)
+            return
+        with self._heap_lock:
+            heapq.heappush(self._deadline_heap,
+                           (deadline, next(self._heap_seq), entity or self, trigger_id))
+        self._wakeup.set()
+
+    def share_scheduler_with(self, owner: "Time"):
+        """Run this entity's triggers on another entity's monitor thread
+
+        Both entities keep their own identity, triggers and stats; only the
+        deadline heap and its single thread are shared, halving wakeups when
+        several Time entities run side by side. Stopping the owner stops the
+        shared triggers as well.
+        """
+        if owner is self or self._scheduler is owner:
+            return
+        with self._heap_lock:
+            migrated = list(self._deadline_heap)
+            self._deadline_heap.clear()
+        for deadline, _, entity, trigger_id in migrated:
+            owner._push_deadline(deadline, trigger_id, entity)
+        self._scheduler = owner
+        print(f"⏰ '{self.name}' triggers now run on '{owner.name}' monitoring thread")
     
     def recurring_trigger(self, interval_seconds: int, start_delay: int = 0):
         """Decorator to register recurring time-based triggers"""
@@ -61,6 +103,7 @@ class Time:
                 "type": "recurring"
             }
             self.scheduled_triggers[trigger_id] = trigger
+            self._push_deadline(time.monotonic() + start_delay, trigger_id)
             print(f"⏰ Registered recurring trigger '{trigger_id}' every {interval_seconds}s")
             return trigger_func
         return decorator
@@ -79,6 +122,7 @@ class Time:
                 "type": "once"
             }
             self.scheduled_triggers[trigger_id] = trigger
+            self._push_deadline(time.monotonic() + delay_seconds, trigger_id)
             print(f"⏰ Registered one-time trigger '{trigger_id}' in {delay_seconds}s")
             return trigger_func
         return decorator
@@ -96,6 +140,7 @@ class Time:
             "type": "recurring"
         }
         self.scheduled_triggers[trigger_id] = trigger
+        self._push_deadline(time.monotonic() + start_delay, trigger_id)
         print(f"⏰ Scheduled recurring trigger '{trigger_id}' every {interval_seconds}s")
     
     def schedule_once_trigger(self, trigger_id: str, delay_seconds: int, trigger_callback: Callable):
@@ -108,10 +153,14 @@ class Time:
             "type": "once"
         }
         self.scheduled_triggers[trigger_id] = trigger
+        self._push_deadline(time.monotonic() + delay_seconds, trigger_id)
         print(f"⏰ Scheduled one-time trigger '{trigger_id}' in {delay_seconds}s")
     
     def start_time_monitoring(self):
         """Start monitoring time for triggers"""
+        if self._scheduler is not self:
+            print(f"⏰ Time monitoring for '{self.name}' handled by '{self._scheduler.name}'")
+            return
         if not self.running:
             self.running = True
             self.scheduler_thread = threading.Thread(target=self._time_monitor_loop)
@@ -120,48 +169,66 @@ class Time:
     
     def stop_time_monitoring(self):
         """Stop time monitoring"""
+        if self._scheduler is not self:
+            print(f"⏰ Time monitoring for '{self.name}' stops with '{self._scheduler.name}'")
+            return
         self.running = False
+        self._wakeup.set()  # Cut the deadline sleep short so the loop exits
         if self.scheduler_thread:
             self.scheduler_thread.join()
         print("⏰ Time monitoring stopped")
     
     def _time_monitor_loop(self):
-        """Main time monitoring loop - checks for triggers to fire"""
+        """Main time monitoring loop - sleeps until the next trigger deadline"""
         while self.running:
-            current_time = datetime.now()
-            self.tick_count += 1
+            with self._heap_lock:
+                entry = heapq.heappop(self._deadline_heap) if self._deadline_heap else None
+            if entry is None:
+                # Nothing scheduled; wait for a registration or stop()
+                self._wakeup.wait(timeout=1.0)
+                self._wakeup.clear()
+                continue
             
-            # Check all scheduled triggers
-            triggers_to_remove = []
-            for trigger_id, trigger in self.scheduled_triggers.items():
-                try:
-                    if trigger["type"] == "recurring":
-                        if current_time >= trigger["next_trigger"]:
-                            # Fire the trigger
-                            print(f"⏰ Time triggered: {trigger_id}")
-                            trigger["callback"]()
-                            trigger["trigger_count"] += 1
-                            trigger["last_trigger"] = current_time
-                            trigger["next_trigger"] = current_time + timedelta(seconds=trigger["interval"])
-                            self.trigger_count += 1
-                    
-                    elif trigger["type"] == "once":
-                        if current_time >= trigger["trigger_time"]:
-                            # Fire the trigger
-                            print(f"⏰ Time triggered (once): {trigger_id}")
-                            trigger["callback"]()
-                            trigger["trigger_count"] += 1
-                            triggers_to_remove.append(trigger_id)
-                            self.trigger_count += 1
+            deadline, _, entity, trigger_id = entry
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                # Not due yet: put the entry back and sleep until its
+                # deadline; a new trigger or stop() sets the event and the
+                # next iteration re-pops whatever is earliest then
+                with self._heap_lock:
+                    heapq.heappush(self._deadline_heap, entry)
+                if self._wakeup.wait(timeout=delay):
+                    self._wakeup.clear()
+                continue
+            
+            trigger = entity.scheduled_triggers.get(trigger_id)
+            if trigger is None:
+                continue  # Stale heap entry for a removed trigger
+            
+            entity.tick_count += 1
+            current_time = datetime.now()
+            try:
+                if trigger["type"] == "recurring":
+                    print(f"⏰ Time triggered: {trigger_id}")
+                    trigger["callback"]()
+                    trigger["trigger_count"] += 1
+                    trigger["last_trigger"] = current_time
+                    entity.trigger_count += 1
                 
-                except Exception as e:
-                    print(f"⏰ Error firing trigger {trigger_id}: {e}")
+                elif trigger["type"] == "once":
+                    print(f"⏰ Time triggered (once): {trigger_id}")
+                    trigger["callback"]()
+                    trigger["trigger_count"] += 1
+                    entity.trigger_count += 1
+                    del entity.scheduled_triggers[trigger_id]
             
-            # Remove completed one-time triggers
-            for trigger_id in triggers_to_remove:
-                del self.scheduled_triggers[trigger_id]
+            except Exception as e:
+                print(f"⏰ Error firing trigger {trigger_id}: {e}")
             
-            time.sleep(1)  # Check every second
+            # Recurring triggers go back on the heap even after an error
+            if trigger["type"] == "recurring":
+                trigger["next_trigger"] = current_time + timedelta(seconds=trigger["interval"])
+                self._push_deadline(time.monotonic() + trigger["interval"], trigger_id, entity)
     
     def get_stats(self) -> Dict:
         """Get time monitoring statistics"""
@@ -706,7 +773,7 @@ def demonstrate_external_entities():
     # Show some completed jobs
     if cleanup_worker.completed_jobs:
         print("Recent completed jobs:")
-        for job in cleanup_worker.completed_jobs[-3:]:  # Show last 3
+        for job in list(cleanup_worker.completed_jobs)[-3:]:  # Show last 3
             print(f"  - {job['type']}: {job['result']} (triggered by: {job['data'].get('reason')})")
     
     # Show registered triggers
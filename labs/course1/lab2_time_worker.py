@@ -29,12 +29,12 @@ Usage:
 """
 
 import time
-import random
 import sys
 import os
 import threading
-import argparse
-from datetime import datetime
+import heapq
+import itertools
+from collections import deque
 from typing import Optional, Dict, List
 
 # Add the repository root to the Python path for imports
@@ -54,32 +54,295 @@ except ImportError:
     sys.exit(1)
 
 
+# The tedious commands for experiment 1, built once at import time. The
+# strings are interned so a correctly typed command can pass the equality
+# check on identity after interning, not a character-by-character compare.
+MANUAL_COMMANDS = (
+    ("Daily Reports", sys.intern("python /opt/business/reports/generate_sales_report.py --date=$(date +%Y-%m-%d) --output=/var/reports/daily/ --format=pdf --include-metrics=revenue,transactions,customers --email-to=management@company.com")),
+    ("User Notifications", sys.intern("bash /scripts/notifications/send_customer_updates.sh --segment=active --template=daily_digest --personalized=true --batch-size=1000 --retry-failures=3")),
+    ("Data Cleanup", sys.intern("sudo find /var/log -name '*.log' -mtime +30 -exec rm {} \\; && df -h | grep -E '^/dev/' | awk '{print $5}' | sed 's/%//'")),
+)
+
+# Trigger narration lines printed on every firing in experiments 2 and 4.
+# Hoisted so each tick reuses one interned constant instead of rebuilding
+# (and re-encoding) the emoji-prefixed literal per invocation.
+TRIGGER_MSG_DAILY_REPORTS = sys.intern("⏰ Time trigger: Scheduling daily reports")
+TRIGGER_MSG_USER_NOTIFICATIONS = sys.intern("⏰ Time trigger: Scheduling user notifications")
+TRIGGER_MSG_DATA_CLEANUP = sys.intern("⏰ Time trigger: Scheduling data cleanup")
+TRIGGER_MSG_UNRELIABLE = sys.intern("⚠️  Scheduling unreliable task (might fail)")
+TRIGGER_MSG_RELIABLE = sys.intern("✅ Scheduling reliable task")
+
+
+# Reflection prompts for experiment 1, hoisted to module level so the large
+# string literals are built once at import time instead of on every run.
+# Responses may reference {mistakes}, filled in per run.
+EXPERIMENT_1_REFLECTIONS = (
+    (
+        "What was the most frustrating aspect of manual command execution?",
+        (
+            "The commands weren't that difficult to type",
+            "The complexity and length of commands with high error risk",
+            "I could memorize these commands with practice"
+        ),
+        (
+            "That's understandable - they might seem manageable at first glance. However, you made {mistakes} mistakes in this calm demo. Complex commands under production pressure create much higher error rates. This is why experienced system thinkers prefer automation for reliability.",
+            "Exactly! Complex commands create cognitive overload and high error risk. You made {mistakes} mistakes in a calm demo - imagine during an outage! This is why system thinkers automate everything. Manual command execution is organizational debt that AI cannot solve.",
+            "That's a natural thought - we often feel we can memorize patterns. However, commands change, parameters evolve, and even with {mistakes} mistakes here, memory fails under stress. Experienced system thinkers know that reliable operations need automation, not human memory."
+        )
+    ),
+    (
+        "If you had to scale this to run every hour for a business with 1000+ users, what would be the biggest challenge?",
+        (
+            "The servers would get overloaded",
+            "The database would run out of space",
+            "The system would break down due to human limitations"
+        ),
+        (
+            "That's a valid concern about infrastructure. Servers can be scaled horizontally though. The fundamental challenge is that manual processes require human operators who can't work continuously, make mistakes, and forget tasks. Technical scaling is actually easier than human scaling.",
+            "Storage is definitely important to monitor. However, the core limitation here is human capacity - people can't manually trigger Worker tasks 24/7 without breaks, vacation, or mistakes. This is why automated Time + Worker patterns become essential for business reliability.",
+            "Absolutely correct! Manual processes don't scale because humans can't work 24/7 with perfect reliability. This is exactly why Instagram, Netflix, and every major platform use Time + Worker patterns for their critical business operations."
+        )
+    ),
+    (
+        "How does this manual experience relate to real-world business systems?",
+        (
+            "Manual processes are fine for small businesses",
+            "Most business Worker tasks need automated Time entities to be reliable",
+            "This was just a simplified demo"
+        ),
+        (
+            "That's a common initial thought for smaller operations. However, even small businesses benefit greatly from automated billing, backups, and notifications. Manual processes create reliability challenges at any size, and Time + Worker patterns help from day one.",
+            "Brilliant connection! Every successful business relies on automated Time + Worker patterns - from Netflix billing cycles to Instagram content moderation. System thinkers understand that reliable business operations require Time + Worker patterns, not manual intervention.",
+            "It might seem simplified, but this demo demonstrates exactly the same challenges that real businesses face! The frustration you felt manually triggering Worker tasks is the same problem that led to automated Time + Worker patterns in every major platform."
+        )
+    ),
+    (
+        "What building block pattern did you just experience manually?",
+        (
+            "I was implementing a Service building block",
+            "I was managing a Queue of tasks",
+            "I was acting as the Time entity triggering Worker tasks"
+        ),
+        (
+            "I can see the connection - there was interaction happening. However, Services handle synchronous request/response patterns. You were actually triggering background tasks that run independently, which is the Worker building block pattern. Services block and wait, but these tasks ran in the background.",
+            "Great observation about the multiple Worker tasks! While there were several tasks, you weren't managing a Queue. You were actually the Time entity triggering Worker building blocks directly. A Queue would store these tasks for processing, but you were manually initiating each one.",
+            "Brilliant connection! You were literally the human Time entity, manually triggering Worker tasks. The commands you typed kicked off background jobs (reports, notifications, cleanup) - classic Worker building block tasks. Automation replaces YOU with a reliable Time entity."
+        )
+    ),
+)
+
+
+# Reflection prompts for experiment 3, static so they are built once.
+EXPERIMENT_3_REFLECTIONS = (
+    (
+        'What would happen if you tried to use ONE Time entity for both Analytics and Compliance needs?',
+        (
+            'It would be simpler and more efficient',
+            "You'd have to compromise - either too frequent for Compliance or too slow for Analytics",
+            'One Time entity would use less memory',
+        ),
+        (
+            "That's a natural thought about simplicity! However, one Time entity would create a complex mess of conditional logic trying to handle different timing requirements. You'd end up with analytics getting stale data or compliance systems being overwhelmed with unnecessary processing.",
+            "Exactly right! This is the core problem that multiple Time entities solve. Analytics needs real-time updates while Compliance needs periodic reports. One Time entity forces you to pick a frequency that doesn't serve either domain well - classic architectural compromise trap.",
+            'Resource efficiency is worth considering! However, the memory savings would be tiny compared to the business impact. Forcing different business domains into one timing pattern creates operational problems far more expensive than running separate Time entities.',
+        )
+    ),
+    (
+        "What's the key architectural insight from seeing the same Worker tasks triggered differently?",
+        (
+            'Worker building blocks should focus on their core functionality, Time entities handle timing requirements',
+            "It's better to write different Worker tasks for different domains",
+            'Multiple Time entities create unnecessary complexity',
+        ),
+        (
+            "Perfect separation of concerns understanding! This is exactly how system thinkers approach architecture - Worker building blocks encapsulate 'how to do the work' while Time entities handle 'when to do the work.' This separation makes systems maintainable and allows business domains to evolve independently - interface design that AI cannot replicate.",
+            'That might seem logical at first! However, duplicating Worker building block code for different domains creates maintenance nightmares and violates the DRY principle. The beauty is that the same business logic (processing sales data) can serve multiple domains with different timing requirements.',
+            'I understand the complexity concern! However, multiple Time entities actually reduce complexity by separating business domain concerns. Trying to handle all timing requirements in one place creates more complex conditional logic and harder-to-understand code.',
+        )
+    ),
+    (
+        'How does this pattern apply to your future system designs?',
+        (
+            'Always create separate Time entities for different teams or departments',
+            'Keep all timing logic in one Time entity for consistency',
+            'Identify when different business domains need the same work done at different frequencies',
+        ),
+        (
+            "That's getting closer to the principle! However, it's not just about teams - it's about business requirements. Create separate Time entities when different business domains have fundamentally different timing needs for the same types of work, regardless of organizational structure.",
+            'Consistency is valuable! However, forcing all business domains into the same timing pattern often creates inconsistency with business requirements. Real consistency means each domain gets the timing it needs for optimal business outcomes.',
+            "Outstanding system thinking! This is exactly how AI-empowered system thinkers approach Time + Worker design. When you hear requirements like 'real-time analytics' and 'daily compliance reports' for similar data, immediately think domain-separated Time entities with shared Worker implementations - pattern recognition that complements AI capabilities.",
+        )
+    ),
+)
+
+
+# Reflection prompts for experiment 4, static so they are built once.
+EXPERIMENT_4_REFLECTIONS = (
+    (
+        'How did the Time + Worker system respond to individual Worker task failures?',
+        (
+            'The Time entity slowed down to handle failures more carefully',
+            'Failed Worker tasks were automatically retried until they succeeded',
+            "Failures were isolated and didn't crash the entire Time + Worker system",
+        ),
+        (
+            "That would be a reasonable safety response! However, the Time entity didn't slow down - it continued at normal speed. The key insight is fault isolation: individual Worker task failures don't affect the overall system operation or other tasks. This separation prevents cascading failures.",
+            "That would be a helpful feature! However, Worker tasks weren't automatically retried in this demo. The important principle is that individual failures don't crash the entire system. Worker building blocks provide fault isolation so the Time entity continues operating despite individual task problems.",
+            "Perfect understanding of resilient architecture! This fault isolation is exactly how Netflix handles millions of operations - individual failures don't bring down the entire platform. This is the difference between code writer and system thinker approaches to system design.",
+        )
+    ),
+    (
+        'What would happen in a Time + Worker system without proper fault isolation?',
+        (
+            'The Time entity would just run more slowly',
+            'Failed Worker tasks would be skipped automatically',
+            'One Worker failure could crash the entire Time + Worker system',
+        ),
+        (
+            'Running slowly would actually be better than what really happens! Without proper fault isolation, one failing Worker task can bring down the entire Time + Worker system, stopping all automation. This is a common failure mode in systems that need better isolation design.',
+            "That would be a nice safety feature! However, without fault isolation, Worker tasks don't get 'skipped' cleanly - they crash the entire system. Worker building blocks provide the boundaries that allow individual Worker tasks to fail safely without affecting the overall Time entity infrastructure.",
+            'Exactly right! Without Worker building blocks, one bad task could crash your entire Time + Worker system. This is why system thinkers use proper fault isolation patterns for business-critical reliability.',
+        )
+    ),
+    (
+        'How does this resilience apply to real business systems?',
+        (
+            'Resilience is only important for large tech companies',
+            'Most businesses can tolerate system downtime',
+            'Business continuity requires systems that work despite individual failures',
+        ),
+        (
+            "That's a common assumption about scale! However, every business - from small e-commerce sites to local service providers - needs resilient systems. Downtime costs money and damages customer trust regardless of company size. Fault isolation benefits all businesses.",
+            'Some businesses might seem more tolerant, but system downtime directly impacts revenue, customer satisfaction, and business reputation. Even small businesses benefit greatly from resilient design with fault isolation for business continuity.',
+            "Outstanding business thinking! Companies can't afford to shut down when one process fails. Banking systems, e-commerce platforms, and streaming services all use these fault isolation patterns to ensure business operations continue despite individual component failures.",
+        )
+    ),
+)
+
+
 class TimeWorkerLabExperience:
-    def __init__(self, instant_print=False):
+    def __init__(self, instant_print=False, time_scale: float = 1.0):
         self.student_name = ""
         self.experiment_times = {}
         self.typewriter_speed = 0.03
         self.instant_print = instant_print
+        # Simulation clock multiplier, matching lab 1's --time-scale: every
+        # simulated sleep, observation window and trigger interval is divided
+        # by this, so --time-scale 10 runs the lab ~10x faster.
+        self.time_scale = max(time_scale, 0.001)
         self.print_lock = threading.Lock()  # Thread-safe printing
+        # Write-optimized logging: each producing thread appends to its own
+        # buffer without locks; the logging thread merges them by timestamp.
+        self._tls = threading.local()
+        self._log_buffers = []
+        self._buffers_lock = threading.Lock()  # guards buffer registration only
+        self._log_event = threading.Event()
+        # True while typewriter_print is mid-animation; the printer thread
+        # holds off flushing so buffered lines never splice into the line
+        self._line_open = False
+        # Set on interrupt so the observation loops exit their tick waits
+        # immediately instead of finishing a multi-second sleep first
+        self._stop_event = threading.Event()
+        self._printer_thread = threading.Thread(target=self._printer_loop, daemon=True)
+        self._printer_thread.start()
+
+    def _flush_pending(self):
+        """Splice every per-thread buffer and write the lines in timestamp order.
+
+        Callers must hold print_lock so a line can never be written twice.
+        """
+        with self._buffers_lock:
+            buffers = list(self._log_buffers)
+        drained = []
+        for buf in buffers:
+            count = len(buf)
+            if count:
+                drained.append(buf[:count])
+                del buf[:count]
+        if drained:
+            merged = heapq.merge(*drained)
+            sys.stdout.write("".join(text + end for _, text, end in merged))
+            sys.stdout.flush()
+
+    def _printer_loop(self):
+        """Wake on new log lines and merge the per-thread buffers to stdout"""
+        while True:
+            self._log_event.wait()
+            self._log_event.clear()
+            with self.print_lock:
+                # Never flush mid-typewriter-line; typewriter_print flushes
+                # itself when the line closes, so nothing is stranded
+                if not self._line_open:
+                    self._flush_pending()
+
+    def _drain_prints(self):
+        """Flush every buffered log line before interactive output"""
+        with self.print_lock:
+            self._flush_pending()
 
     def typewriter_print(self, text: str, speed: Optional[float] = None, end: str = "\n"):
         """Print text with typewriter effect (thread-safe)"""
+        self._drain_prints()
+        if self.instant_print:
+            # A single write is atomic under the GIL, so the fast path needs
+            # no lock at all - nothing can interleave inside one write call.
+            sys.stdout.write(text + end)
+            sys.stdout.flush()
+            return
+        if speed is None:
+            speed = self.typewriter_speed
+        # Render the full animation schedule first, then replay it: each
+        # chunk goes straight to the fd with one os.write, so emission costs
+        # one syscall per word and the lock is never held across a sleep.
+        schedule = []
+        for i, word in enumerate(text.split(" ")):
+            chunk = word if i == 0 else " " + word
+            visible_chars = sum(1 for char in word if char not in " \n\t")
+            schedule.append((speed * visible_chars, chunk.encode()))
+        schedule.append((0.0, end.encode()))
+
+        sys.stdout.flush()
+        fd = sys.stdout.fileno()
         with self.print_lock:
-            if self.instant_print:
-                print(text, end=end)
-                return
-            if speed is None:
-                speed = self.typewriter_speed
-            for char in text:
-                print(char, end='', flush=True)
-                if char not in [' ', '\n', '\t']:
-                    time.sleep(speed)
-            print(end=end)
+            self._line_open = True
+        try:
+            for delay, chunk in schedule:
+                with self.print_lock:
+                    os.write(fd, chunk)
+                if delay:
+                    time.sleep(delay)
+        finally:
+            # Close the line and write anything the workers logged while
+            # the animation was running
+            with self.print_lock:
+                self._line_open = False
+                self._flush_pending()
     
+    def _pause(self, seconds: float):
+        """Sleep for a simulated duration, scaled by time_scale"""
+        time.sleep(seconds / self.time_scale)
+
     def direct_print(self, text: str, end: str = "\n"):
-        """Print text directly without typewriter effect (thread-safe)"""
-        with self.print_lock:
-            print(text, end=end)
+        """Buffer text for the logging thread without the typewriter effect.
+
+        The hot path is a lock-free append to this thread's own buffer; only
+        first use from a new thread touches the registration lock.
+        """
+        buf = getattr(self._tls, "log_buf", None)
+        if buf is None:
+            buf = self._tls.log_buf = []
+            with self._buffers_lock:
+                self._log_buffers.append(buf)
+        buf.append((time.monotonic(), text, end))
+        self._log_event.set()
+
+    def direct_print_block(self, lines: List[str], end: str = "\n"):
+        """Buffer several lines as one unit so they can never interleave
+
+        A block becomes a single buffer entry, so the logging thread writes
+        it contiguously no matter what other threads log in between.
+        """
+        self.direct_print("\n".join(lines), end=end)
 
     def ask_multiple_choice(self, question: str, choices: List[str], responses: List[str]) -> str:
         """Ask a multiple choice question with educational responses"""
@@ -130,51 +393,47 @@ class TimeWorkerLabExperience:
         self.typewriter_print("Any typo means starting over - just like in production systems.")
         print()
         
-        # Define the tedious commands
-        commands = {
-            "Daily Reports": "python /opt/business/reports/generate_sales_report.py --date=$(date +%Y-%m-%d) --output=/var/reports/daily/ --format=pdf --include-metrics=revenue,transactions,customers --email-to=management@company.com",
-            "User Notifications": "bash /scripts/notifications/send_customer_updates.sh --segment=active --template=daily_digest --personalized=true --batch-size=1000 --retry-failures=3",
-            "Data Cleanup": "sudo find /var/log -name '*.log' -mtime +30 -exec rm {} \\; && df -h | grep -E '^/dev/' | awk '{print $5}' | sed 's/%//'"
-        }
-        
-        start_time = time.time()
+        start_time = time.monotonic()
         mistakes = 0
         task_times = []
         
-        for task_name, command in commands.items():
-            task_start = time.time()
+        for task_name, command in MANUAL_COMMANDS:
+            task_start = time.monotonic()
             
             self.typewriter_print(f"\n🚨 WORKER TASK: {task_name}")
             self.typewriter_print("📋 Type this command EXACTLY (copy-paste is disabled in production!):")
             print(f"\n   {command}\n")
             
             attempts = 0
+            command_length = len(command)
             while True:
                 attempts += 1
                 user_input = input("👤 Type command: ").strip()
-                
+
+                # str.__eq__ already early-exits in C on length and identity
+                # (the command is interned), so no manual pre-check beats it
                 if user_input == command:
                     self.typewriter_print("✅ Command accepted! Executing Worker task...")
                     
                     # Simulate Worker task execution with progress
                     if task_name == "Daily Reports":
-                        self.typewriter_print(f"🔧 [Worker Building Block Starting] Generating daily reports at {datetime.now().strftime('%H:%M:%S')}")
+                        self.typewriter_print(f"🔧 [Worker Building Block Starting] Generating daily reports at {time.strftime('%H:%M:%S')}")
                         for i in range(3):
-                            time.sleep(1)
+                            self._pause(1)
                             self.typewriter_print(f"   ... processing data ({i+1}/3)")
                         self.typewriter_print("✅ [Worker Building Block Complete] Daily reports generated")
                     
                     elif task_name == "User Notifications":
-                        self.typewriter_print(f"🔧 [Worker Building Block Starting] Sending notifications at {datetime.now().strftime('%H:%M:%S')}")
+                        self.typewriter_print(f"🔧 [Worker Building Block Starting] Sending notifications at {time.strftime('%H:%M:%S')}")
                         for i in range(2):
-                            time.sleep(1)
+                            self._pause(1)
                             self.typewriter_print(f"   ... sending batch ({i+1}/2)")
                         self.typewriter_print("✅ [Worker Building Block Complete] Notifications sent")
                     
                     else:  # Data Cleanup
-                        self.typewriter_print(f"🔧 [Worker Building Block Starting] Cleaning data at {datetime.now().strftime('%H:%M:%S')}")
+                        self.typewriter_print(f"🔧 [Worker Building Block Starting] Cleaning data at {time.strftime('%H:%M:%S')}")
                         for i in range(4):
-                            time.sleep(1)
+                            self._pause(1)
                             self.typewriter_print(f"   ... removing old files ({i+1}/4)")
                         self.typewriter_print("✅ [Worker Building Block Complete] Cleanup finished")
                     
@@ -183,17 +442,19 @@ class TimeWorkerLabExperience:
                     mistakes += 1
                     self.typewriter_print("❌ INCORRECT! Every character must match exactly.")
                     
-                    # Show hints about what went wrong
-                    if len(user_input) < len(command):
+                    # Show hints, cheapest check first: the common miscount
+                    # case resolves on the O(1) length compare alone
+                    input_length = len(user_input)
+                    if input_length < command_length:
                         self.typewriter_print("💡 Your command is too short")
-                    elif len(user_input) > len(command):
+                    elif input_length > command_length:
                         self.typewriter_print("💡 Your command is too long")
                     else:
-                        # Find first difference
-                        for i, (c1, c2) in enumerate(zip(command, user_input)):
-                            if c1 != c2:
-                                self.typewriter_print(f"💡 First error at position {i+1}: expected '{c1}', got '{c2}'")
-                                break
+                        # Find first difference; commonprefix scans at C speed
+                        # and stops at the first mismatching character
+                        i = len(os.path.commonprefix([command, user_input]))
+                        if i < command_length:
+                            self.typewriter_print(f"💡 First error at position {i+1}: expected '{command[i]}', got '{user_input[i]}'")
                     
                     if attempts >= 2:
                         self.typewriter_print("😤 This is exhausting! And it's only 9 AM...")
@@ -201,20 +462,20 @@ class TimeWorkerLabExperience:
                         self.typewriter_print("🔥 In production, these mistakes could break the system!")
                     print()
             
-            task_time = time.time() - task_start
+            task_time = time.monotonic() - task_start
             task_times.append(task_time)
             
             # Simulate forgetting or delays between tasks
             if task_name == "Daily Reports":
                 self.typewriter_print("\n😴 You got pulled into a meeting...")
-                time.sleep(2)
+                self._pause(2)
                 self.typewriter_print("⏰ Oh no! Almost forgot about notifications!")
             elif task_name == "User Notifications":
                 self.typewriter_print("\n☕ Quick coffee break...")
-                time.sleep(2)
+                self._pause(2)
                 self.typewriter_print("🚨 ALERT: Disk space at 95%! Need cleanup NOW!")
         
-        total_time = time.time() - start_time
+        total_time = time.monotonic() - start_time
         
         self.typewriter_print(f"\n📊 MANUAL EXECUTION SUMMARY:")
         self.typewriter_print(f"   Total time: {total_time:.1f} seconds")
@@ -227,62 +488,13 @@ class TimeWorkerLabExperience:
         self.typewriter_print(f"   💀 Reality: This is just 3 Worker tasks. Real ops teams manage 50+")
         
         # Multiple choice reflections
-        self.ask_multiple_choice(
-            "What was the most frustrating aspect of manual command execution?",
-            [
-                "The commands weren't that difficult to type",
-                "The complexity and length of commands with high error risk",
-                "I could memorize these commands with practice"
-            ],
-            [
-                "That's understandable - they might seem manageable at first glance. However, you made {} mistakes in this calm demo. Complex commands under production pressure create much higher error rates. This is why experienced system thinkers prefer automation for reliability.".format(mistakes),
-                "Exactly! Complex commands create cognitive overload and high error risk. You made {} mistakes in a calm demo - imagine during an outage! This is why system thinkers automate everything. Manual command execution is organizational debt that AI cannot solve.".format(mistakes),
-                "That's a natural thought - we often feel we can memorize patterns. However, commands change, parameters evolve, and even with {} mistakes here, memory fails under stress. Experienced system thinkers know that reliable operations need automation, not human memory.".format(mistakes)
-            ]
-        )
-        
-        self.ask_multiple_choice(
-            "If you had to scale this to run every hour for a business with 1000+ users, what would be the biggest challenge?",
-            [
-                "The servers would get overloaded",
-                "The database would run out of space",
-                "The system would break down due to human limitations"
-            ],
-            [
-                "That's a valid concern about infrastructure. Servers can be scaled horizontally though. The fundamental challenge is that manual processes require human operators who can't work continuously, make mistakes, and forget tasks. Technical scaling is actually easier than human scaling.",
-                "Storage is definitely important to monitor. However, the core limitation here is human capacity - people can't manually trigger Worker tasks 24/7 without breaks, vacation, or mistakes. This is why automated Time + Worker patterns become essential for business reliability.",
-                "Absolutely correct! Manual processes don't scale because humans can't work 24/7 with perfect reliability. This is exactly why Instagram, Netflix, and every major platform use Time + Worker patterns for their critical business operations."
-            ]
-        )
-        
-        self.ask_multiple_choice(
-            "How does this manual experience relate to real-world business systems?", 
-            [
-                "Manual processes are fine for small businesses",
-                "Most business Worker tasks need automated Time entities to be reliable",
-                "This was just a simplified demo"
-            ],
-            [
-                "That's a common initial thought for smaller operations. However, even small businesses benefit greatly from automated billing, backups, and notifications. Manual processes create reliability challenges at any size, and Time + Worker patterns help from day one.",
-                "Brilliant connection! Every successful business relies on automated Time + Worker patterns - from Netflix billing cycles to Instagram content moderation. System thinkers understand that reliable business operations require Time + Worker patterns, not manual intervention.",
-                "It might seem simplified, but this demo demonstrates exactly the same challenges that real businesses face! The frustration you felt manually triggering Worker tasks is the same problem that led to automated Time + Worker patterns in every major platform."
-            ]
-        )
-        
-        self.ask_multiple_choice(
-            "What building block pattern did you just experience manually?",
-            [
-                "I was implementing a Service building block",
-                "I was managing a Queue of tasks",
-                "I was acting as the Time entity triggering Worker tasks"
-            ],
-            [
-                "I can see the connection - there was interaction happening. However, Services handle synchronous request/response patterns. You were actually triggering background tasks that run independently, which is the Worker building block pattern. Services block and wait, but these tasks ran in the background.",
-                "Great observation about the multiple Worker tasks! While there were several tasks, you weren't managing a Queue. You were actually the Time entity triggering Worker building blocks directly. A Queue would store these tasks for processing, but you were manually initiating each one.",
-                "Brilliant connection! You were literally the human Time entity, manually triggering Worker tasks. The commands you typed kicked off background jobs (reports, notifications, cleanup) - classic Worker building block tasks. Automation replaces YOU with a reliable Time entity."
-            ]
-        )
-        
+        for question, choices, responses in EXPERIMENT_1_REFLECTIONS:
+            self.ask_multiple_choice(
+                question,
+                list(choices),
+                [response.format(mistakes=mistakes) for response in responses]
+            )
+
         self.experiment_times["experiment_1"] = total_time
         
         # Pause before next experiment
@@ -306,9 +518,14 @@ class TimeWorkerLabExperience:
         self.typewriter_print("Notice how your role changes from manual operator to system observer.")
         print()
         
+        import random  # deferred: only the automation experiments need it
+
         start_time = time.time()
-        
+
         # Create Time entity for triggering Worker tasks
+        # (These run on real threads rather than an asyncio event loop on
+        # purpose: the lab teaches the Time and Worker building blocks, and
+        # students should see the same Worker machinery the other labs use.)
         business_time_entity = Time("business_scheduler")
         
         # Create Worker building block for background processing
@@ -317,23 +534,20 @@ class TimeWorkerLabExperience:
         # Business Worker tasks (same functionality, but now automated)
         def process_daily_reports(data=None):
             processing_time = random.uniform(3, 5)
-            time.sleep(processing_time)
-            with self.print_lock:
-                print(f"📊 Daily reports completed automatically at {datetime.now().strftime('%H:%M:%S')}")
+            self._pause(processing_time)
+            self.direct_print(f"📊 Daily reports completed automatically at {time.strftime('%H:%M:%S')}")
             return {"status": "completed", "processing_time": processing_time}
 
         def process_user_notifications(data=None):
             processing_time = random.uniform(2, 4)
-            time.sleep(processing_time)
-            with self.print_lock:
-                print(f"📧 User notifications sent automatically at {datetime.now().strftime('%H:%M:%S')}")
+            self._pause(processing_time)
+            self.direct_print(f"📧 User notifications sent automatically at {time.strftime('%H:%M:%S')}")
             return {"status": "completed", "processing_time": processing_time}
 
         def cleanup_old_data(data=None):
             processing_time = random.uniform(4, 6)
-            time.sleep(processing_time)
-            with self.print_lock:
-                print(f"🧹 Data cleanup completed automatically at {datetime.now().strftime('%H:%M:%S')}")
+            self._pause(processing_time)
+            self.direct_print(f"🧹 Data cleanup completed automatically at {time.strftime('%H:%M:%S')}")
             return {"status": "completed", "processing_time": processing_time}
         
         # Register Worker task types with the Worker building block
@@ -342,21 +556,21 @@ class TimeWorkerLabExperience:
         task_worker.register_job_type("data_cleanup", cleanup_old_data)
         
         # Set up Time entity triggers for Worker tasks (shorter intervals for demo)
-        @business_time_entity.recurring_trigger(interval_seconds=8, start_delay=2)
+        @business_time_entity.recurring_trigger(interval_seconds=8 / self.time_scale, start_delay=2 / self.time_scale)
         def trigger_daily_reports():
-            self.direct_print("⏰ Time trigger: Scheduling daily reports")
+            self.direct_print(TRIGGER_MSG_DAILY_REPORTS)
             job_id = task_worker.submit_job("daily_reports", {})
             self.direct_print(f"📝 Job {job_id} submitted for background processing")
         
-        @business_time_entity.recurring_trigger(interval_seconds=12, start_delay=5)
+        @business_time_entity.recurring_trigger(interval_seconds=12 / self.time_scale, start_delay=5 / self.time_scale)
         def trigger_user_notifications():
-            self.direct_print("⏰ Time trigger: Scheduling user notifications")
+            self.direct_print(TRIGGER_MSG_USER_NOTIFICATIONS)
             job_id = task_worker.submit_job("user_notifications", {})
             self.direct_print(f"📝 Job {job_id} submitted for background processing")
         
-        @business_time_entity.recurring_trigger(interval_seconds=15, start_delay=8)
+        @business_time_entity.recurring_trigger(interval_seconds=15 / self.time_scale, start_delay=8 / self.time_scale)
         def trigger_data_cleanup():
-            self.direct_print("⏰ Time trigger: Scheduling data cleanup")
+            self.direct_print(TRIGGER_MSG_DATA_CLEANUP)
             job_id = task_worker.submit_job("data_cleanup", {})
             self.direct_print(f"📝 Job {job_id} submitted for background processing")
         
@@ -370,17 +584,25 @@ class TimeWorkerLabExperience:
         task_worker.start()
         
         try:
-            start_time = time.time()
-            while time.time() - start_time < 25:  # Run for 25 seconds
-                elapsed = int(time.time() - start_time)
+            # monotonic cannot jump backwards under clock adjustments, and a
+            # single get_stats() snapshot per tick keeps lock traffic low
+            start_time = time.monotonic()
+            deadline = start_time + 25 / self.time_scale
+            while time.monotonic() < deadline:  # Run for 25 seconds
+                elapsed = int(time.monotonic() - start_time)
                 stats = task_worker.get_stats()
-                
-                self.direct_print(f"\n🔄 Automated system running... ({elapsed}s elapsed)")
-                self.direct_print(f"📈 Worker stats: Completed: {stats['completed_jobs']}, "
-                                f"Failed: {stats['failed_jobs']}, "
-                                f"Success Rate: {stats['success_rate']:.1f}%")
-                self.direct_print("✅ You can focus on other work while automation handles tasks!")
-                time.sleep(5)
+                completed = stats['completed_jobs']
+                failed = stats['failed_jobs']
+                success_rate = stats['success_rate']
+
+                self.direct_print_block([
+                    f"\n🔄 Automated system running... ({elapsed}s elapsed)",
+                    f"📈 Worker stats: Completed: {completed}, "
+                    f"Failed: {failed}, "
+                    f"Success Rate: {success_rate:.1f}%",
+                    "✅ You can focus on other work while automation handles tasks!"
+                ])
+                self._pause(5)
         
         except KeyboardInterrupt:
             self.typewriter_print("\n🛑 Stopping automated Time + Worker system...")
@@ -390,7 +612,7 @@ class TimeWorkerLabExperience:
             task_worker.stop()
             
             # Show final statistics
-            total_time = time.time() - start_time
+            total_time = time.monotonic() - start_time
             final_stats = task_worker.get_stats()
             self.typewriter_print(f"\n📊 AUTOMATION SUMMARY:")
             self.typewriter_print(f"   Total elapsed time: {total_time:.1f} seconds")
@@ -483,74 +705,89 @@ class TimeWorkerLabExperience:
         self.typewriter_print("Imagine trying to create one Time entity that handles both requirements...")
         print()
         
-        # Create specialized Time entities for different business domains
+        import random
+
+        # Create specialized Time entities for different business domains.
+        # They keep separate identities and trigger schedules, but one
+        # monitor thread can serve both deadline heaps.
         analytics_time_entity = Time("customer_analytics")
         compliance_time_entity = Time("compliance_audit")
+        compliance_time_entity.share_scheduler_with(analytics_time_entity)
         
         # Single Worker building block shared by both domains (same functionality, different timing)
-        shared_worker = Worker("e_commerce_processor")
+        # 2x the three job types so short analytics jobs aren't stuck in
+        # line behind long-running compliance audits
+        shared_worker = Worker("e_commerce_processor", max_concurrent_jobs=6)
         
         # Shared Worker tasks that both domains need (same functionality, different frequencies)
-        def process_sales_data(data=None):
-            domain = data.get('domain', 'unknown') if data else 'unknown'
-            processing_time = random.uniform(1.5, 2.5)
-            time.sleep(processing_time)
-            with self.print_lock:
-                print(f"📊 Sales data processed for {domain} at {datetime.now().strftime('%H:%M:%S')}")
-            return {"worker_task": "sales_data", "domain": domain, "processing_time": processing_time}
-        
-        def generate_user_behavior_report(data=None):
-            domain = data.get('domain', 'unknown') if data else 'unknown'
-            processing_time = random.uniform(2, 3)
-            time.sleep(processing_time)
-            with self.print_lock:
-                print(f"👥 User behavior report generated for {domain} at {datetime.now().strftime('%H:%M:%S')}")
-            return {"worker_task": "user_behavior", "domain": domain, "processing_time": processing_time}
-        
-        def audit_transaction_logs(data=None):
-            domain = data.get('domain', 'unknown') if data else 'unknown'
-            processing_time = random.uniform(1, 2)
-            time.sleep(processing_time)
-            with self.print_lock:
-                print(f"🔍 Transaction logs audited for {domain} at {datetime.now().strftime('%H:%M:%S')}")
-            return {"worker_task": "transaction_audit", "domain": domain, "processing_time": processing_time}
-        
+        def make_domain_task(worker_task, narration, min_seconds, max_seconds):
+            """Build a shared Worker task; only narration and timing vary"""
+            def task(data=None):
+                domain = data.get('domain', 'unknown') if data else 'unknown'
+                processing_time = random.uniform(min_seconds, max_seconds)
+                self._pause(processing_time)
+                self.direct_print(f"{narration.format(domain)} at {time.strftime('%H:%M:%S')}")
+                return {"worker_task": worker_task, "domain": domain, "processing_time": processing_time}
+            return task
+
         # Register shared Worker tasks with the single Worker building block
-        shared_worker.register_job_type("sales_data", process_sales_data)
-        shared_worker.register_job_type("user_behavior", generate_user_behavior_report)
-        shared_worker.register_job_type("transaction_audit", audit_transaction_logs)
-        
-        # ANALYTICS DOMAIN: Needs frequent updates (high-frequency Time triggers)
-        @analytics_time_entity.recurring_trigger(interval_seconds=4, start_delay=1)
-        def analytics_sales_data():
-            self.direct_print("📈 [ANALYTICS] Frequent trigger: Processing sales data for dashboards")
-            shared_worker.submit_job("sales_data", {"domain": "ANALYTICS"})
-        
-        @analytics_time_entity.recurring_trigger(interval_seconds=6, start_delay=2)
-        def analytics_user_behavior():
-            self.direct_print("📈 [ANALYTICS] Frequent trigger: User behavior for live insights")
-            shared_worker.submit_job("user_behavior", {"domain": "ANALYTICS"})
-        
-        @analytics_time_entity.recurring_trigger(interval_seconds=8, start_delay=3)
-        def analytics_transaction_audit():
-            self.direct_print("📈 [ANALYTICS] Frequent trigger: Transaction patterns analysis")
-            shared_worker.submit_job("transaction_audit", {"domain": "ANALYTICS"})
-        
-        # COMPLIANCE DOMAIN: Needs less frequent but regular updates (lower-frequency Time triggers)
-        @compliance_time_entity.recurring_trigger(interval_seconds=12, start_delay=5)
-        def compliance_sales_data():
-            self.direct_print("🏛️  [COMPLIANCE] Regulatory trigger: Sales data for compliance reports")
-            shared_worker.submit_job("sales_data", {"domain": "COMPLIANCE"})
-        
-        @compliance_time_entity.recurring_trigger(interval_seconds=18, start_delay=8)
-        def compliance_user_behavior():
-            self.direct_print("🏛️  [COMPLIANCE] Regulatory trigger: User behavior for audit trail")
-            shared_worker.submit_job("user_behavior", {"domain": "COMPLIANCE"})
-        
-        @compliance_time_entity.recurring_trigger(interval_seconds=15, start_delay=10)
-        def compliance_transaction_audit():
-            self.direct_print("🏛️  [COMPLIANCE] Regulatory trigger: Full transaction audit")
-            shared_worker.submit_job("transaction_audit", {"domain": "COMPLIANCE"})
+        shared_worker.register_job_type(
+            "sales_data", make_domain_task("sales_data", "📊 Sales data processed for {}", 1.5, 2.5))
+        shared_worker.register_job_type(
+            "user_behavior", make_domain_task("user_behavior", "👥 User behavior report generated for {}", 2, 3))
+        shared_worker.register_job_type(
+            "transaction_audit", make_domain_task("transaction_audit", "🔍 Transaction logs audited for {}", 1, 2))
+        
+        # Consolidation array for trigger submissions: each trigger appends
+        # its job, and whichever caller wins the flush lock hands the whole
+        # batch to the Worker in a single lock acquisition. Triggers from
+        # both Time entities that fire together coalesce automatically.
+        pending_submissions = deque()
+        flush_lock = threading.Lock()
+
+        def submit_batched(job_type, domain):
+            pending_submissions.append((job_type, {"domain": domain}))
+            if flush_lock.acquire(blocking=False):
+                try:
+                    batch = []
+                    while pending_submissions:
+                        batch.append(pending_submissions.popleft())
+                    if batch:
+                        shared_worker.submit_jobs(batch)
+                finally:
+                    flush_lock.release()
+
+        # Trigger schedule for both domains in one table: Time entities stay
+        # separate (that separation is the lesson), but the six trigger
+        # closures collapse into data plus a single factory.
+        # Fields: interval_seconds, start_delay, job_type, narration
+        analytics_schedule = (
+            (4, 1, "sales_data", "📈 [ANALYTICS] Frequent trigger: Processing sales data for dashboards"),
+            (6, 2, "user_behavior", "📈 [ANALYTICS] Frequent trigger: User behavior for live insights"),
+            (8, 3, "transaction_audit", "📈 [ANALYTICS] Frequent trigger: Transaction patterns analysis"),
+        )
+        compliance_schedule = (
+            (12, 5, "sales_data", "🏛️  [COMPLIANCE] Regulatory trigger: Sales data for compliance reports"),
+            (18, 8, "user_behavior", "🏛️  [COMPLIANCE] Regulatory trigger: User behavior for audit trail"),
+            (15, 10, "transaction_audit", "🏛️  [COMPLIANCE] Regulatory trigger: Full transaction audit"),
+        )
+
+        def make_trigger(narration, job_type, domain):
+            def fire():
+                self.direct_print(narration)
+                submit_batched(job_type, domain)
+            return fire
+
+        for entity, domain, schedule in (
+            (analytics_time_entity, "ANALYTICS", analytics_schedule),
+            (compliance_time_entity, "COMPLIANCE", compliance_schedule),
+        ):
+            for interval, delay, job_type, narration in schedule:
+                entity.schedule_recurring_trigger(
+                    f"{domain.lower()}_{job_type}", interval / self.time_scale,
+                    make_trigger(narration, job_type, domain),
+                    start_delay=delay / self.time_scale
+                )
         
         self.typewriter_print("📈 Starting Analytics Time entity (high-frequency for live dashboards)...")
         self.typewriter_print("🏛️  Starting Compliance Time entity (lower-frequency for regulatory needs)...")
@@ -563,27 +800,43 @@ class TimeWorkerLabExperience:
         compliance_time_entity.start_time_monitoring()
         shared_worker.start()
         
-        analytics_jobs = 0
-        compliance_jobs = 0
-        
+        # The Worker tallies completions by (job_type, domain) as they
+        # finish, so a tick only folds a handful of counter entries instead
+        # of touching the completed-jobs list at all
+        def domain_total(domain):
+            return sum(count for (_, job_domain), count
+                       in shared_worker.completion_counts.items()
+                       if job_domain == domain)
+
         try:
-            start_time = time.time()
-            while time.time() - start_time < 22:  # Run for 22 seconds
-                elapsed = int(time.time() - start_time)
+            self._stop_event.clear()
+            # Idle ticks double the wait up to 8s; any activity resets it
+            base_tick = 4 / self.time_scale
+            tick = base_tick
+            last_total = 0
+            start_time = time.monotonic()
+            while time.monotonic() - start_time < 22 / self.time_scale:  # Run for 22 seconds
+                elapsed = int(time.monotonic() - start_time)
                 
                 # Count jobs by domain
-                completed_jobs = shared_worker.completed_jobs
-                analytics_jobs = sum(1 for job in completed_jobs if job.get('result', {}).get('domain') == 'ANALYTICS')
-                compliance_jobs = sum(1 for job in completed_jobs if job.get('result', {}).get('domain') == 'COMPLIANCE')
-                
-                self.direct_print(f"\n🏢 Domain-separated Time + Worker patterns running... ({elapsed}s elapsed)")
-                self.direct_print(f"   📈 Analytics jobs (high-freq): {analytics_jobs} completed")
-                self.direct_print(f"   🏛️  Compliance jobs (low-freq): {compliance_jobs} completed")
-                self.direct_print("   💡 Same Worker tasks, different Time entity requirements!")
+                analytics_jobs = domain_total("ANALYTICS")
+                compliance_jobs = domain_total("COMPLIANCE")
                 
-                time.sleep(4)
+                self.direct_print_block([
+                    f"\n🏢 Domain-separated Time + Worker patterns running... ({elapsed}s elapsed)",
+                    f"   📈 Analytics jobs (high-freq): {analytics_jobs} completed",
+                    f"   🏛️  Compliance jobs (low-freq): {compliance_jobs} completed",
+                    "   💡 Same Worker tasks, different Time entity requirements!"
+                ])
+
+                total = analytics_jobs + compliance_jobs
+                tick = min(tick * 2, 8 / self.time_scale) if total == last_total else base_tick
+                last_total = total
+                if self._stop_event.wait(tick):
+                    break
                 
         except KeyboardInterrupt:
+            self._stop_event.set()
             self.typewriter_print("\n🛑 Stopping all Time entities...")
         
         finally:
@@ -591,60 +844,25 @@ class TimeWorkerLabExperience:
             compliance_time_entity.stop_time_monitoring()
             shared_worker.stop()
             
-            # Final count
-            completed_jobs = shared_worker.completed_jobs
-            analytics_final = sum(1 for job in completed_jobs if job.get('result', {}).get('domain') == 'ANALYTICS')
-            compliance_final = sum(1 for job in completed_jobs if job.get('result', {}).get('domain') == 'COMPLIANCE')
+            # Final count picks up whatever completed after the last tick
+            analytics_final = domain_total("ANALYTICS")
+            compliance_final = domain_total("COMPLIANCE")
             
+            # Only the banner gets the typewriter; the numeric lines go out
+            # directly so teardown is not held up by animation sleeps
             self.typewriter_print(f"\n📊 DOMAIN SEPARATION SUMMARY:")
-            self.typewriter_print(f"   📈 Analytics domain: {analytics_final} jobs (high-frequency)")
-            self.typewriter_print(f"   🏛️  Compliance domain: {compliance_final} jobs (lower-frequency)")
-            self.typewriter_print(f"   🔧 Total shared Worker tasks executed: {analytics_final + compliance_final}")
-            self.typewriter_print(f"   💡 Same Worker building block, different Time entity timing - perfect separation!")
-            self.typewriter_print(f"   🎯 Each domain got exactly the frequency it needed!")
+            self.direct_print_block([
+                f"   📈 Analytics domain: {analytics_final} jobs (high-frequency)",
+                f"   🏛️  Compliance domain: {compliance_final} jobs (lower-frequency)",
+                f"   🔧 Total shared Worker tasks executed: {analytics_final + compliance_final}",
+                "   💡 Same Worker building block, different Time entity timing - perfect separation!",
+                "   🎯 Each domain got exactly the frequency it needed!"
+            ])
+            self._drain_prints()
         
         # Multiple choice reflections
-        self.ask_multiple_choice(
-            "What would happen if you tried to use ONE Time entity for both Analytics and Compliance needs?",
-            [
-                "It would be simpler and more efficient",
-                "You'd have to compromise - either too frequent for Compliance or too slow for Analytics",
-                "One Time entity would use less memory"
-            ],
-            [
-                "That's a natural thought about simplicity! However, one Time entity would create a complex mess of conditional logic trying to handle different timing requirements. You'd end up with analytics getting stale data or compliance systems being overwhelmed with unnecessary processing.",
-                "Exactly right! This is the core problem that multiple Time entities solve. Analytics needs real-time updates while Compliance needs periodic reports. One Time entity forces you to pick a frequency that doesn't serve either domain well - classic architectural compromise trap.",
-                "Resource efficiency is worth considering! However, the memory savings would be tiny compared to the business impact. Forcing different business domains into one timing pattern creates operational problems far more expensive than running separate Time entities."
-            ]
-        )
-        
-        self.ask_multiple_choice(
-            "What's the key architectural insight from seeing the same Worker tasks triggered differently?",
-            [
-                "Worker building blocks should focus on their core functionality, Time entities handle timing requirements",
-                "It's better to write different Worker tasks for different domains",
-                "Multiple Time entities create unnecessary complexity"
-            ],
-            [
-                "Perfect separation of concerns understanding! This is exactly how system thinkers approach architecture - Worker building blocks encapsulate 'how to do the work' while Time entities handle 'when to do the work.' This separation makes systems maintainable and allows business domains to evolve independently - interface design that AI cannot replicate.",
-                "That might seem logical at first! However, duplicating Worker building block code for different domains creates maintenance nightmares and violates the DRY principle. The beauty is that the same business logic (processing sales data) can serve multiple domains with different timing requirements.",
-                "I understand the complexity concern! However, multiple Time entities actually reduce complexity by separating business domain concerns. Trying to handle all timing requirements in one place creates more complex conditional logic and harder-to-understand code."
-            ]
-        )
-        
-        self.ask_multiple_choice(
-            "How does this pattern apply to your future system designs?",
-            [
-                "Always create separate Time entities for different teams or departments",
-                "Keep all timing logic in one Time entity for consistency",
-                "Identify when different business domains need the same work done at different frequencies"
-            ],
-            [
-                "That's getting closer to the principle! However, it's not just about teams - it's about business requirements. Create separate Time entities when different business domains have fundamentally different timing needs for the same types of work, regardless of organizational structure.",
-                "Consistency is valuable! However, forcing all business domains into the same timing pattern often creates inconsistency with business requirements. Real consistency means each domain gets the timing it needs for optimal business outcomes.",
-                "Outstanding system thinking! This is exactly how AI-empowered system thinkers approach Time + Worker design. When you hear requirements like 'real-time analytics' and 'daily compliance reports' for similar data, immediately think domain-separated Time entities with shared Worker implementations - pattern recognition that complements AI capabilities."
-            ]
-        )
+        for question, choices, responses in EXPERIMENT_3_REFLECTIONS:
+            self.ask_multiple_choice(question, list(choices), list(responses))
         
         # Pause before next experiment
         print("\n" + "="*50)
@@ -666,32 +884,40 @@ class TimeWorkerLabExperience:
         self.typewriter_print("Some Worker tasks will deliberately fail to demonstrate fault isolation.")
         print()
         
+        import random
+
         # Create resilient Time entity and Worker building block
         resilient_time_entity = Time("resilient_system")
-        resilient_worker = Worker("resilient_processor")
+        # 2x the two job types: reliable jobs keep flowing even while
+        # several unreliable ones are mid-retry
+        resilient_worker = Worker("resilient_processor", max_concurrent_jobs=4)
         
-        # Track failures for educational purposes
-        self.failure_count = 0
+        # The first two invocations always fail so the demo reliably shows
+        # fault isolation. next() on an itertools.count is a single C call,
+        # so concurrent pool threads cannot lose updates the way += on a
+        # shared attribute can.
+        invocation_counter = itertools.count()
         
         # Worker task that sometimes fails
         def unreliable_task(data=None):
-            # Ensure some failures occur for demonstration
-            if random.random() < 0.4 or self.failure_count < 2:  # 40% failure rate, ensure at least 2 failures
-                self.failure_count += 1
-                raise Exception(f"Simulated external service failure at {datetime.now().strftime('%H:%M:%S')}")
+            # Ensure some failures occur for demonstration; getrandbits skips
+            # the float conversion (102/256 keeps the ~40% failure rate)
+            if next(invocation_counter) < 2 or random.getrandbits(8) < 102:  # 40% failure rate, ensure at least 2 failures
+                # A real raise, not a sentinel return: the point of this
+                # experiment is watching the Worker isolate an actual
+                # exception, and failed_jobs counts exceptions by contract
+                raise Exception(f"Simulated external service failure at {time.strftime('%H:%M:%S')}")
             
             processing_time = random.uniform(1, 2)
-            time.sleep(processing_time)
-            with self.print_lock:
-                print(f"✅ Unreliable task completed successfully at {datetime.now().strftime('%H:%M:%S')}")
+            self._pause(processing_time)
+            self.direct_print(f"✅ Unreliable task completed successfully at {time.strftime('%H:%M:%S')}")
             return {"status": "success", "processing_time": processing_time}
         
         # Worker task that always succeeds
         def reliable_task(data=None):
             processing_time = random.uniform(0.5, 1)
-            time.sleep(processing_time)
-            with self.print_lock:
-                print(f"🟢 Reliable task completed at {datetime.now().strftime('%H:%M:%S')}")
+            self._pause(processing_time)
+            self.direct_print(f"🟢 Reliable task completed at {time.strftime('%H:%M:%S')}")
             return {"status": "success", "processing_time": processing_time}
         
         # Register Worker tasks with error handling
@@ -699,14 +925,14 @@ class TimeWorkerLabExperience:
         resilient_worker.register_job_type("reliable_task", reliable_task)
         
         # Set up Time triggers for Worker tasks
-        @resilient_time_entity.recurring_trigger(interval_seconds=4, start_delay=1)
+        @resilient_time_entity.recurring_trigger(interval_seconds=4 / self.time_scale, start_delay=1 / self.time_scale)
         def trigger_unreliable_work():
-            self.direct_print("⚠️  Scheduling unreliable task (might fail)")
+            self.direct_print(TRIGGER_MSG_UNRELIABLE)
             resilient_worker.submit_job("unreliable_task", {})
         
-        @resilient_time_entity.recurring_trigger(interval_seconds=3, start_delay=2) 
+        @resilient_time_entity.recurring_trigger(interval_seconds=3 / self.time_scale, start_delay=2 / self.time_scale)
         def trigger_reliable_work():
-            self.direct_print("✅ Scheduling reliable task")
+            self.direct_print(TRIGGER_MSG_RELIABLE)
             resilient_worker.submit_job("reliable_task", {})
         
         self.typewriter_print("🧪 Testing Time + Worker system resilience with failing tasks...")
@@ -718,20 +944,36 @@ class TimeWorkerLabExperience:
         resilient_worker.start()
         
         try:
-            start_time = time.time()
-            while time.time() - start_time < 16:  # Run for 16 seconds
-                elapsed = int(time.time() - start_time)
-                stats = resilient_worker.get_stats()
-                
-                self.direct_print(f"\n💪 Resilient Time + Worker system running... ({elapsed}s elapsed)")
-                self.direct_print(f"   ✅ Successful Worker jobs: {stats['completed_jobs']}")
-                self.direct_print(f"   ❌ Failed Worker jobs: {stats['failed_jobs']}")
-                self.direct_print(f"   📊 Success rate: {stats['success_rate']:.1f}%")
-                self.direct_print(f"   🎯 Time entity still operational despite Worker task failures!")
+            self._stop_event.clear()
+            # Same idle backoff as experiment 3, from a 3s base up to 12s
+            base_tick = 3 / self.time_scale
+            tick = base_tick
+            last_total = 0
+            start_time = time.monotonic()
+            while time.monotonic() - start_time < 16 / self.time_scale:  # Run for 16 seconds
+                elapsed = int(time.monotonic() - start_time)
+                # Plain length reads; no stats-dict construction per tick
+                completed = len(resilient_worker.completed_jobs)
+                failed = len(resilient_worker.failed_jobs)
+                finished = completed + failed
+                success_rate = 100.0 * completed / finished if finished else 0.0
                 
-                time.sleep(3)
+                self.direct_print_block([
+                    f"\n💪 Resilient Time + Worker system running... ({elapsed}s elapsed)",
+                    f"   ✅ Successful Worker jobs: {completed}",
+                    f"   ❌ Failed Worker jobs: {failed}",
+                    f"   📊 Success rate: {success_rate:.1f}%",
+                    "   🎯 Time entity still operational despite Worker task failures!"
+                ])
+
+                total = finished
+                tick = min(tick * 2, 12 / self.time_scale) if total == last_total else base_tick
+                last_total = total
+                if self._stop_event.wait(tick):
+                    break
                 
         except KeyboardInterrupt:
+            self._stop_event.set()
             self.typewriter_print("\n🛑 Stopping resilient Time + Worker system...")
         
         finally:
@@ -740,54 +982,18 @@ class TimeWorkerLabExperience:
             
             final_stats = resilient_worker.get_stats()
             self.typewriter_print(f"\n📊 RESILIENCE TEST SUMMARY:")
-            self.typewriter_print(f"   Total Worker jobs attempted: {final_stats['total_jobs']}")
-            self.typewriter_print(f"   Successful Worker completions: {final_stats['completed_jobs']}")
-            self.typewriter_print(f"   Failed Worker jobs: {final_stats['failed_jobs']}")
-            self.typewriter_print(f"   System availability: {final_stats['success_rate']:.1f}%")
-            self.typewriter_print(f"   🎯 Time + Worker system remained operational despite {final_stats['failed_jobs']} failures!")
+            self.direct_print_block([
+                f"   Total Worker jobs attempted: {final_stats['total_jobs']}",
+                f"   Successful Worker completions: {final_stats['completed_jobs']}",
+                f"   Failed Worker jobs: {final_stats['failed_jobs']}",
+                f"   System availability: {final_stats['success_rate']:.1f}%",
+                f"   🎯 Time + Worker system remained operational despite {final_stats['failed_jobs']} failures!"
+            ])
+            self._drain_prints()
         
         # Multiple choice reflections
-        self.ask_multiple_choice(
-            "How did the Time + Worker system respond to individual Worker task failures?",
-            [
-                "The Time entity slowed down to handle failures more carefully",
-                "Failed Worker tasks were automatically retried until they succeeded",
-                "Failures were isolated and didn't crash the entire Time + Worker system"
-            ],
-            [
-                "That would be a reasonable safety response! However, the Time entity didn't slow down - it continued at normal speed. The key insight is fault isolation: individual Worker task failures don't affect the overall system operation or other tasks. This separation prevents cascading failures.",
-                "That would be a helpful feature! However, Worker tasks weren't automatically retried in this demo. The important principle is that individual failures don't crash the entire system. Worker building blocks provide fault isolation so the Time entity continues operating despite individual task problems.",
-                "Perfect understanding of resilient architecture! This fault isolation is exactly how Netflix handles millions of operations - individual failures don't bring down the entire platform. This is the difference between code writer and system thinker approaches to system design."
-            ]
-        )
-        
-        self.ask_multiple_choice(
-            "What would happen in a Time + Worker system without proper fault isolation?",
-            [
-                "The Time entity would just run more slowly",
-                "Failed Worker tasks would be skipped automatically",
-                "One Worker failure could crash the entire Time + Worker system"
-            ],
-            [
-                "Running slowly would actually be better than what really happens! Without proper fault isolation, one failing Worker task can bring down the entire Time + Worker system, stopping all automation. This is a common failure mode in systems that need better isolation design.",
-                "That would be a nice safety feature! However, without fault isolation, Worker tasks don't get 'skipped' cleanly - they crash the entire system. Worker building blocks provide the boundaries that allow individual Worker tasks to fail safely without affecting the overall Time entity infrastructure.",
-                "Exactly right! Without Worker building blocks, one bad task could crash your entire Time + Worker system. This is why system thinkers use proper fault isolation patterns for business-critical reliability."
-            ]
-        )
-        
-        self.ask_multiple_choice(
-            "How does this resilience apply to real business systems?",
-            [
-                "Resilience is only important for large tech companies",
-                "Most businesses can tolerate system downtime",
-                "Business continuity requires systems that work despite individual failures"
-            ],
-            [
-                "That's a common assumption about scale! However, every business - from small e-commerce sites to local service providers - needs resilient systems. Downtime costs money and damages customer trust regardless of company size. Fault isolation benefits all businesses.",
-                "Some businesses might seem more tolerant, but system downtime directly impacts revenue, customer satisfaction, and business reputation. Even small businesses benefit greatly from resilient design with fault isolation for business continuity.",
-                "Outstanding business thinking! Companies can't afford to shut down when one process fails. Banking systems, e-commerce platforms, and streaming services all use these fault isolation patterns to ensure business operations continue despite individual component failures."
-            ]
-        )
+        for question, choices, responses in EXPERIMENT_4_REFLECTIONS:
+            self.ask_multiple_choice(question, list(choices), list(responses))
         
         # Pause before conclusion
         print("\n" + "="*50)
@@ -908,6 +1114,8 @@ class TimeWorkerLabExperience:
 
 def main():
     """Main function to run the Time + Worker Discovery Lab"""
+    import argparse  # deferred so bare experiment runs skip the parser cost
+
     parser = argparse.ArgumentParser(
         description="Lesson 8: Time + Worker - Scheduled Processing Discovery Lab",
         epilog="Examples:\n"
@@ -928,12 +1136,20 @@ def main():
     parser.add_argument(
         '--fast',
         action='store_true',
-        help='Disable typewriter effect for instant output'
+        help='Disable typewriter effect and sprint through simulated waits'
     )
-    
+
+    parser.add_argument(
+        '--time-scale',
+        type=float,
+        default=1.0,
+        help='Divide all simulated durations, windows and trigger intervals by this factor (e.g. 10 for a 10x faster lab)'
+    )
+
     args = parser.parse_args()
-    
-    lab = TimeWorkerLabExperience(instant_print=args.fast)
+
+    time_scale = 100.0 if args.fast else args.time_scale
+    lab = TimeWorkerLabExperience(instant_print=args.fast, time_scale=time_scale)
     try:
         if args.experiment:
             lab.run_single_experiment(args.experiment)